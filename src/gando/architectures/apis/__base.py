@@ -1,7 +1,11 @@
-from inspect import currentframe, getframeinfo
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
 from pydantic import BaseModel
+from types import MappingProxyType
 from typing import Any
-import importlib
+import asyncio
+import sys
 
 from gando.http.responses.string_messages import (
     InfoStringMessage,
@@ -25,6 +29,8 @@ from gando.utils.messages import (
 )
 from gando.config import SETTINGS
 
+from django.db import close_old_connections
+
 from rest_framework.exceptions import ErrorDetail
 from rest_framework import exceptions, status
 from rest_framework.response import Response
@@ -37,12 +43,137 @@ from rest_framework.generics import (
     DestroyAPIView as DRFGDestroyAPIView,
 )
 
+_THIS_FILE = __file__
+
+_AUTH_EXCEPTIONS = (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+
+_PAGE_KEYS = frozenset(('count', 'next', 'previous', 'results'))
+
+_DEFAULT_MESSAGES = {
+    201: 'The desired object was created correctly.',
+    400: 'Bad Request...',
+    401: 'Your authentication information is not available.',
+    403: 'You do not have access to this section.',
+    404: 'There is no information about your request.',
+    421: (
+        "An unexpected error has occurred based on your request type.\n"
+        "Please do not repeat this request without changing your request.\n"
+        "Be sure to read the documents on how to use this service correctly.\n"
+        "In any case, discuss the issue with software support.\n"
+    ),
+}
+_DEFAULT_RANGE_MESSAGES = (
+    (100, 200, 'please wait...'),
+    (200, 300, 'Your request has been successfully registered.'),
+    (300, 400, 'The requirements for your request are not available.'),
+    (400, 500, 'There was an error in how to send the request.'),
+    (500, float('inf'), 'The server is unable to respond to your request.'),
+)
+
+
+@lru_cache(maxsize=128)
+def _default_message_for(status_code: int) -> str:
+    msg = _DEFAULT_MESSAGES.get(status_code)
+    if msg:
+        return msg
+
+    for lower, upper, msg in _DEFAULT_RANGE_MESSAGES:
+        if lower <= status_code < upper:
+            return msg
+
+    return 'Undefined.'
+
+
+def _messenger_entry(msg):
+    return msg.message, msg.code, msg.type
+
+
+_DEFAULT_MESSENGER_MESSAGES = {
+    201: _messenger_entry(DefaultResponse201SuccessMessage),
+    400: _messenger_entry(DefaultResponse400FailMessage),
+    401: _messenger_entry(DefaultResponse401FailMessage),
+    403: _messenger_entry(DefaultResponse403FailMessage),
+    404: _messenger_entry(DefaultResponse404FailMessage),
+    421: _messenger_entry(DefaultResponse421FailMessage),
+}
+_DEFAULT_RANGE_MESSENGER_MESSAGES = {
+    1: _messenger_entry(DefaultResponse100FailMessage),
+    2: _messenger_entry(DefaultResponse200SuccessMessage),
+    3: _messenger_entry(DefaultResponse300FailMessage),
+    4: _messenger_entry(DefaultResponse400FailMessage),
+    5: _messenger_entry(DefaultResponse500FailMessage),
+}
+
+# (message key, setter name) for every status code below 600; codes outside
+# that range are clamped onto it.
+_DEFAULT_MESSAGE_BUCKETS = tuple(
+    (sys.intern('status_code_xxx'), 'set_error_message') if status_code < 100 else
+    (sys.intern('status_code_1xx'), 'set_warning_message') if status_code < 200 else
+    (sys.intern('status_code_2xx'), 'set_info_message') if status_code < 300 else
+    (sys.intern(f'status_code_{status_code // 100}xx'), 'set_error_message')
+    for status_code in range(600)
+)
+
+_NODE_LEAF = 0
+_NODE_CONTAINER = 1
+_NODE_DETAIL = 2
+_NODE_MESSAGE = 3
+
+# type -> (node kind, name of the BaseAPI setter that records it)
+_NODE_KINDS = {
+    str: (_NODE_LEAF, None),
+    list: (_NODE_CONTAINER, None),
+    dict: (_NODE_CONTAINER, None),
+    InfoStringMessage: (_NODE_MESSAGE, 'set_info_message'),
+    ErrorStringMessage: (_NODE_MESSAGE, 'set_error_message'),
+    ErrorDetail: (_NODE_DETAIL, 'set_error_message'),
+    WarningStringMessage: (_NODE_MESSAGE, 'set_warning_message'),
+    LogStringMessage: (_NODE_MESSAGE, 'set_log_message'),
+    ExceptionStringMessage: (_NODE_MESSAGE, 'set_exception_message'),
+}
+_MESSAGE_NODES = tuple((t, node) for t, node in _NODE_KINDS.items() if node[1])
+
+
+def _node_kind(type_):
+    node = _NODE_KINDS.get(type_)
+    if node is None:
+        if issubclass(type_, (list, dict)):
+            node = (_NODE_CONTAINER, None)
+        else:
+            node = next(
+                (n for t, n in _MESSAGE_NODES if issubclass(type_, t)),
+                (_NODE_LEAF, None),
+            )
+        _NODE_KINDS[type_] = node
+    return node
+
+
+def _children(container):
+    return enumerate(container) if isinstance(container, list) else iter(container.items())
+
+
+@lru_cache(maxsize=None)
+def _monitor_pool():
+    return ThreadPoolExecutor(max_workers=SETTINGS.MONITOR_WORKERS, thread_name_prefix='gando-monitor')
+
+
+def _call_off_request_thread(func, *args, **kwargs):
+    # Django only recycles database connections on the request thread, so a
+    # monitor running on a long-lived worker thread cleans up after itself.
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
 
 class BaseAPI(APIView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.__messenger = []
+        self.__messenger_has_fail_or_error = False
+        self.__messenger_has_warning = False
 
         self.__data = None
 
@@ -63,24 +194,21 @@ class BaseAPI(APIView):
         self.__content_type: str | None = None
         self.__exception_status: bool = False
 
+        self.__host: str | None = None
+
     def __paste_to_request_func_loader(self, f, request, *args, **kwargs):
         try:
-            mod_name, func_name = f.rsplit('.', 1)
-            mod = importlib.import_module(mod_name)
-            func = getattr(mod, func_name)
-
-            return func(request=request, *args, **kwargs)
+            return f(request=request, *args, **kwargs)
         except PassException as exc:
-            frame_info = getframeinfo(currentframe())
             self.set_log_message(
                 key='pass',
                 value=f"message:{exc.args[0]}, "
-                      f"file_name: {frame_info.filename}, "
-                      f"line_number: {frame_info.lineno}")
+                      f"file_name: {_THIS_FILE}, "
+                      f"line_number: {exc.__traceback__.tb_lineno}")
             return None
 
     def paste_to_request_func_loader_play(self, request, *args, **kwargs):
-        for key, f in SETTINGS.PASTE_TO_REQUEST.items():
+        for key, f in SETTINGS.paste_to_request_callables:
             rslt = self.__paste_to_request_func_loader(f, request, *args, **kwargs)
             if rslt:
                 setattr(request, key, rslt)
@@ -99,13 +227,9 @@ class BaseAPI(APIView):
             return self._handle_exception_gando_handling_true(exc)
         return self._handle_exception_gando_handling_false(exc)
 
-    def _handle_exception_gando_handling_true(self, exc):
-        """
-        Handle any exception that occurs, by returning an appropriate response,
-        or re-raising the error.
-        """
-        if isinstance(exc, (exceptions.NotAuthenticated,
-                            exceptions.AuthenticationFailed)):
+    def __prepare_auth_exception(self, exc):
+        if isinstance(exc, _AUTH_EXCEPTIONS):
+            # WWW-Authenticate header for 401 responses, else coerce to 403
             auth_header = self.get_authenticate_header(self.request)
 
             if auth_header:
@@ -113,6 +237,13 @@ class BaseAPI(APIView):
             else:
                 exc.status_code = status.HTTP_403_FORBIDDEN
 
+    def _handle_exception_gando_handling_true(self, exc):
+        """
+        Handle any exception that occurs, by returning an appropriate response,
+        or re-raising the error.
+        """
+        self.__prepare_auth_exception(exc)
+
         exception_handler = self.get_exception_handler()
 
         context = self.get_exception_handler_context()
@@ -156,15 +287,7 @@ class BaseAPI(APIView):
         Handle any exception that occurs, by returning an appropriate response,
         or re-raising the error.
         """
-        if isinstance(exc, (exceptions.NotAuthenticated,
-                            exceptions.AuthenticationFailed)):
-            # WWW-Authenticate header for 401 responses, else coerce to 403
-            auth_header = self.get_authenticate_header(self.request)
-
-            if auth_header:
-                exc.auth_header = auth_header
-            else:
-                exc.status_code = status.HTTP_403_FORBIDDEN
+        self.__prepare_auth_exception(exc)
 
         exception_handler = self.get_exception_handler()
 
@@ -181,40 +304,26 @@ class BaseAPI(APIView):
         if isinstance(response, Response):
             self.helper()
 
-            tmp = response.template_name if hasattr(response, 'template_name') else None
-            template_name = tmp
-
-            tmp = response.headers if hasattr(response, 'headers') else None
-            headers = self.get_headers(tmp)
+            headers = self.get_headers(getattr(response, 'headers', None))
+            exception = self.get_exception_status(getattr(response, 'exception', None))
+            content_type = getattr(response, 'content_type', None)
+            status_code = self.get_status_code(getattr(response, 'status_code', None))
+            data = self.response_context(getattr(response, 'data', None))
 
-            tmp = response.exception if hasattr(response, 'exception') else None
-            exception = self.get_exception_status(tmp)
+            response.data = data
+            response.status_code = status_code
+            response.exception = exception
+            response.content_type = content_type
+            for k, v in headers.items():
+                response[k] = v
 
-            tmp = response.content_type if hasattr(response, 'content_type') else None
-            content_type = tmp
+            delete_cookie = response.delete_cookie
+            for i in self.__cookies_for_delete:
+                delete_cookie(i)
 
-            tmp = response.status_code if hasattr(response, 'status_code') else None
-            status_code = self.get_status_code(tmp)
-
-            tmp = response.data if hasattr(response, 'data') else None
-            data = self.response_context(tmp)
-
-            response = Response(
-                data=data,
-                status=status_code,
-                template_name=template_name,
-                headers=headers,
-                exception=exception,
-                content_type=content_type,
-            )
-
-            if self.__cookies_for_delete:
-                for i in self.__cookies_for_delete:
-                    response.delete_cookie(i)
-
-            if self.__cookies_for_set:
-                for i in self.__cookies_for_set:
-                    response.set_cookie(**i)
+            set_cookie = response.set_cookie
+            for i in self.__cookies_for_set:
+                set_cookie(**i)
 
         return super().finalize_response(request, response, *args, **kwargs)
 
@@ -222,7 +331,6 @@ class BaseAPI(APIView):
         self.__data = self.__set_messages_from_data(data)
 
         status_code = self.get_status_code()
-        content_type = self.get_content_type()
         data = self.validate_data()
         many = self.__many()
 
@@ -231,12 +339,8 @@ class BaseAPI(APIView):
         has_warning = self.__has_warning()
         exception_status = self.get_exception_status()
 
-        messages = self.__messages()
-
         success = self.__success()
 
-        headers = self.get_headers()
-
         tmp = {
             'success': success,
 
@@ -245,7 +349,11 @@ class BaseAPI(APIView):
             'has_warning': has_warning,
             'exception_status': exception_status,
 
-            'monitor': self.monitor_play(monitor),
+            'monitor': (
+                async_to_sync(self.monitor_play_async)(monitor)
+                if SETTINGS.MONITOR_ASYNC and SETTINGS.MONITOR
+                else self.monitor_play(monitor)
+            ),
 
             'messenger': self.__messenger,
 
@@ -253,10 +361,10 @@ class BaseAPI(APIView):
             'data': data,
         }
         if self.__debug_status:
-            # tmp['headers'] = headers
+            # tmp['headers'] = self.get_headers()
             pass
         if self.__messages_response_displayed:
-            tmp['development_messages'] = messages
+            tmp['development_messages'] = self.__messages()
 
         ret = tmp
         return ret
@@ -269,6 +377,10 @@ class BaseAPI(APIView):
                 'message': message,
             }
         )
+        if type_ == 'FAIL' or type_ == 'ERROR':
+            self.__messenger_has_fail_or_error = True
+        elif type_ == 'WARNING':
+            self.__messenger_has_warning = True
 
     def add_fail_message_to_messenger(self, message, code):
         self.__add_to_messenger(
@@ -299,72 +411,53 @@ class BaseAPI(APIView):
         )
 
     def set_log_message(self, key, value):
-        log = {key: value}
-        self.__logs_message.append(log)
+        self.__logs_message.append((key, value))
 
     def set_info_message(self, key, value):
-        info = {key: value}
-        self.__infos_message.append(info)
+        self.__infos_message.append((key, value))
 
     def set_warning_message(self, key, value):
-        warning = {key: value}
-        self.__warnings_message.append(warning)
+        self.__warnings_message.append((key, value))
 
     def set_error_message(self, key, value):
-        error = {key: value}
-        self.__errors_message.append(error)
+        self.__errors_message.append((key, value))
 
     def set_exception_message(self, key, value):
-        exception = {key: value}
-        self.__exceptions_message.append(exception)
+        self.__exceptions_message.append((key, value))
 
     def set_headers(self, key, value):
         self.__headers[key] = value
 
     def get_headers(self, value: dict = None):
         if value:
+            set_headers = self.set_headers
             for k, v in value.items():
-                self.set_headers(k, v)
+                set_headers(k, v)
         return self.__headers
 
     def __messages(self, ) -> dict:
         tmp = {
-            'info': self.__infos_message,
-            'warning': self.__warnings_message,
-            'error': self.__errors_message,
+            'info': [{k: v} for k, v in self.__infos_message],
+            'warning': [{k: v} for k, v in self.__warnings_message],
+            'error': [{k: v} for k, v in self.__errors_message],
 
         }
         if self.__debug_status:
-            tmp['log'] = self.__logs_message
-            tmp['exception'] = self.__exceptions_message
+            tmp['log'] = [{k: v} for k, v in self.__logs_message]
+            tmp['exception'] = [{k: v} for k, v in self.__exceptions_message]
 
         ret = tmp
         return ret
 
     def __many(self):
-        if isinstance(self.__data, list):
-            return True
-        if (
-            isinstance(self.__data, dict) and
-            'count' in self.__data and
-            'next' in self.__data and
-            'previous' in self.__data and
-            'results' in self.__data
-        ):
-            return True
-        return False
+        data = self.__data
+        return isinstance(data, list) or (isinstance(data, dict) and _PAGE_KEYS <= data.keys())
 
     def __fail_message_messenger(self):
-        for msg in self.__messenger:
-            if msg.get('type', '') == 'FAIL' or msg.get('type', '') == 'ERROR':
-                return True
-        return False
+        return self.__messenger_has_fail_or_error
 
     def __warning_message_messenger(self):
-        for msg in self.__messenger:
-            if msg.get('type', '') == 'WARNING':
-                return True
-        return False
+        return self.__messenger_has_warning
 
     def __success(self):
         if (
@@ -414,28 +507,70 @@ class BaseAPI(APIView):
 
     def __monitor_func_loader(self, f, *args, **kwargs):
         try:
-            mod_name, func_name = f.rsplit('.', 1)
-            mod = importlib.import_module(mod_name)
-            func = getattr(mod, func_name)
-
-            return func(request=self.request, *args, **kwargs)
+            return f(request=self.request, *args, **kwargs)
         except PassException as exc:
-            frame_info = getframeinfo(currentframe())
             self.set_log_message(
                 key='pass',
                 value=f"message:{exc.args[0]}, "
-                      f"file_name: {frame_info.filename}, "
-                      f"line_number: {frame_info.lineno}")
+                      f"file_name: {_THIS_FILE}, "
+                      f"line_number: {exc.__traceback__.tb_lineno}")
             return None
 
     def monitor_play(self, monitor=None, *args, **kwargs):
         monitor = monitor or {}
-        for key, f in SETTINGS.MONITOR.items():
+        if not SETTINGS.MONITOR:
+            return monitor
+
+        items = SETTINGS.monitor_callables
+        if SETTINGS.MONITOR_WORKERS and len(items) > 1:
+            pool = _monitor_pool()
+            loader = self.__monitor_func_loader
+            futures = [
+                (key, pool.submit(_call_off_request_thread, loader, f, *args, **kwargs))
+                for key, f in items
+            ]
+            for key, future in futures:
+                monitor[key] = future.result()
+            return monitor
+
+        for key, f in items:
             monitor[key] = self.__monitor_func_loader(f, *args, **kwargs)
 
         return monitor
 
-    @property
+    async def __monitor_func_loader_async(self, f, *args, **kwargs):
+        try:
+            if not iscoroutinefunction(f):
+                f = sync_to_async(partial(_call_off_request_thread, f), thread_sensitive=False)
+
+            return await f(request=self.request, *args, **kwargs)
+        except PassException as exc:
+            self.set_log_message(
+                key='pass',
+                value=f"message:{exc.args[0]}, "
+                      f"file_name: {_THIS_FILE}, "
+                      f"line_number: {exc.__traceback__.tb_lineno}")
+            return None
+
+    async def monitor_play_async(self, monitor=None, *args, **kwargs):
+        """
+        Same as monitor_play, but runs the monitor functions concurrently.
+        Coroutine functions are awaited directly, plain functions are run
+        in worker threads, so they must be safe to call side by side.
+        """
+        monitor = monitor or {}
+        if not SETTINGS.MONITOR:
+            return monitor
+
+        items = SETTINGS.monitor_callables
+        results = await asyncio.gather(
+            *[self.__monitor_func_loader_async(f, *args, **kwargs) for _, f in items]
+        )
+        monitor.update(zip([key for key, _ in items], results))
+
+        return monitor
+
+    @cached_property
     def __allowed_monitor_keys(self):
         return SETTINGS.MONITOR_KEYS
 
@@ -446,7 +581,7 @@ class BaseAPI(APIView):
             self.__set_default_message()
             tmp = {'result': {}}
 
-        elif isinstance(data, str) or issubclass(type(data), str):
+        elif isinstance(data, str):
             data = self.__set_dynamic_message(data)
             tmp = {'result': {'string': data} if data else {}}
 
@@ -467,11 +602,11 @@ class BaseAPI(APIView):
         ret = tmp
         return ret
 
-    @property
+    @cached_property
     def __debug_status(self):
         return SETTINGS.DEBUG
 
-    @property
+    @cached_property
     def __messages_response_displayed(self):
         return SETTINGS.MESSAGES_RESPONSE_DISPLAYED
 
@@ -486,7 +621,9 @@ class BaseAPI(APIView):
         return rsp
 
     def get_host(self):
-        return self.request._request._current_scheme_host
+        if self.__host is None:
+            self.__host = self.request._request._current_scheme_host
+        return self.__host
 
     def append_host_to_url(self, value):
         ret = f'{self.get_host()}{value}'
@@ -511,203 +648,100 @@ class BaseAPI(APIView):
         pass
 
     def __default_message(self):
-        status_code = self.get_status_code()
-
-        if 100 <= status_code < 200:
-            msg = 'please wait...'
-
-        elif 200 <= status_code < 300:
-            if status_code == 201:
-                msg = 'The desired object was created correctly.'
-            else:
-                msg = 'Your request has been successfully registered.'
-
-        elif 300 <= status_code < 400:
-            msg = 'The requirements for your request are not available.'
-
-        elif 400 <= status_code < 500:
-            if status_code == 400:
-                msg = 'Bad Request...'
-
-            elif status_code == 401:
-                msg = 'Your authentication information is not available.'
-
-            elif status_code == 403:
-                msg = 'You do not have access to this section.'
-
-            elif status_code == 404:
-                msg = 'There is no information about your request.'
-
-            elif status_code == 421:
-                msg = (
-                    "An unexpected error has occurred based on your request type.\n"
-                    "Please do not repeat this request without changing your request.\n"
-                    "Be sure to read the documents on how to use this service correctly.\n"
-                    "In any case, discuss the issue with software support.\n"
-                )
-
-            else:
-                msg = 'There was an error in how to send the request.'
-
-        elif 500 <= status_code:
-            msg = 'The server is unable to respond to your request.'
-
-        else:
-            msg = 'Undefined.'
-
-        return msg
+        return _default_message_for(self.get_status_code())
 
     def __default_messenger_message_adder(self):
         status_code = self.get_status_code()
 
-        if 100 <= status_code < 200:
-            self.__add_to_messenger(
-                message=DefaultResponse100FailMessage.message,
-                code=DefaultResponse100FailMessage.code,
-                type_=DefaultResponse100FailMessage.type,
-            )
-
-        elif 200 <= status_code < 300:
-            if status_code == 201:
-                self.__add_to_messenger(
-                    message=DefaultResponse201SuccessMessage.message,
-                    code=DefaultResponse201SuccessMessage.code,
-                    type_=DefaultResponse201SuccessMessage.type,
-                )
-            else:
-                self.__add_to_messenger(
-                    message=DefaultResponse200SuccessMessage.message,
-                    code=DefaultResponse200SuccessMessage.code,
-                    type_=DefaultResponse200SuccessMessage.type,
-                )
-
-        elif 300 <= status_code < 400:
-            self.__add_to_messenger(
-                message=DefaultResponse300FailMessage.message,
-                code=DefaultResponse300FailMessage.code,
-                type_=DefaultResponse300FailMessage.type,
-            )
-
-        elif 400 <= status_code < 500:
-            if status_code == 400:
-                self.__add_to_messenger(
-                    message=DefaultResponse400FailMessage.message,
-                    code=DefaultResponse400FailMessage.code,
-                    type_=DefaultResponse400FailMessage.type,
-                )
-
-            elif status_code == 401:
-                self.__add_to_messenger(
-                    message=DefaultResponse401FailMessage.message,
-                    code=DefaultResponse401FailMessage.code,
-                    type_=DefaultResponse401FailMessage.type,
-                )
-
-            elif status_code == 403:
-                self.__add_to_messenger(
-                    message=DefaultResponse403FailMessage.message,
-                    code=DefaultResponse403FailMessage.code,
-                    type_=DefaultResponse403FailMessage.type,
-                )
-
-            elif status_code == 404:
-                self.__add_to_messenger(
-                    message=DefaultResponse404FailMessage.message,
-                    code=DefaultResponse404FailMessage.code,
-                    type_=DefaultResponse404FailMessage.type,
-                )
-
-            elif status_code == 421:
-                self.__add_to_messenger(
-                    message=DefaultResponse421FailMessage.message,
-                    code=DefaultResponse421FailMessage.code,
-                    type_=DefaultResponse421FailMessage.type,
-                )
-
-            else:
-                self.__add_to_messenger(
-                    message=DefaultResponse400FailMessage.message,
-                    code=DefaultResponse400FailMessage.code,
-                    type_=DefaultResponse400FailMessage.type,
-                )
-
-        elif 500 <= status_code:
+        entry = (
+            _DEFAULT_MESSENGER_MESSAGES.get(status_code) or
+            _DEFAULT_RANGE_MESSENGER_MESSAGES.get(min(status_code // 100, 5))
+        )
+        if entry is not None:
+            message, code, type_ = entry
             self.__add_to_messenger(
-                message=DefaultResponse500FailMessage.message,
-                code=DefaultResponse500FailMessage.code,
-                type_=DefaultResponse500FailMessage.type,
+                message=message,
+                code=code,
+                type_=type_,
             )
 
-        else:
-            pass
-
     def __set_default_message(self):
         self.__default_messenger_message_adder()
 
         status_code = self.get_status_code()
 
-        if 100 <= status_code < 200:
-            self.set_warning_message('status_code_1xx', self.__default_message())
-
-        elif 200 <= status_code < 300:
-            self.set_info_message('status_code_2xx', self.__default_message())
-
-        elif 300 <= status_code < 400:
-            self.set_error_message('status_code_3xx', self.__default_message())
-
-        elif 400 <= status_code < 500:
-            self.set_error_message('status_code_4xx', self.__default_message())
-
-        elif 500 <= status_code:
-            self.set_error_message('status_code_5xx', self.__default_message())
-
-        else:
-            self.set_error_message('status_code_xxx', self.__default_message())
+        key, setter = _DEFAULT_MESSAGE_BUCKETS[min(max(status_code, 0), 599)]
+        getattr(self, setter)(key, self.__default_message())
 
     def __set_messages_from_data(self, data):
-        if isinstance(data, str) or issubclass(type(data), str):
+        if isinstance(data, str):
             return self.__set_dynamic_message(data)
 
-        if isinstance(data, list):
-            tmp = []
-            for i in data:
-                rslt = self.__set_messages_from_data(i)
-                if rslt:
-                    tmp.append(rslt)
+        if not isinstance(data, (list, dict)):
+            return data
+
+        # Walk the payload without modifying it: message strings are recorded
+        # and left out, and a container is copied the first time one of its
+        # slots changes, so lists and dicts owned by the caller are never
+        # touched. Error details are recorded too but stay in the payload,
+        # since the development messages are not always part of the response.
+        stack = []
+        container, children, copy = data, _children(data), None
+        is_list = isinstance(data, list)
+        while True:
+            for key, value in children:
+                type_ = type(value)
+                if type_ is int or type_ is float or type_ is bool or value is None:
+                    kind, setter = _NODE_LEAF, None
+                else:
+                    kind, setter = _node_kind(type_)
+
+                if kind == _NODE_CONTAINER:
+                    stack.append((container, children, copy, is_list, key))
+                    container, children, copy = value, _children(value), None
+                    is_list = isinstance(value, list)
+                    break
+
+                if setter is not None:
+                    getattr(self, setter)(key=value.code, value=value)
+
+                if kind == _NODE_MESSAGE:
+                    if is_list:
+                        if copy is None:
+                            copy = container[:key]
+                    else:
+                        if copy is None:
+                            copy = dict(container)
+                        del copy[key]
+                    continue
+
+                if copy is not None and is_list:
+                    copy.append(value)
 
-            ret = tmp
-            return ret
-
-        if isinstance(data, dict):
-            tmp = {}
-            for k, v in data.items():
-                rslt = self.__set_messages_from_data(v)
-                if rslt is not None:
-                    tmp[k] = v
-
-            ret = tmp
-            return ret
-
-        return data
+            else:
+                changed = copy is not None
+                value = copy if changed else container
+                if not stack:
+                    return value
+
+                container, children, copy, is_list, key = stack.pop()
+                if is_list:
+                    if changed and copy is None:
+                        copy = container[:key]
+                    if copy is not None:
+                        copy.append(value)
+                elif changed:
+                    if copy is None:
+                        copy = dict(container)
+                    copy[key] = value
 
     def __set_dynamic_message(self, value):
-        if isinstance(value, InfoStringMessage):
-            self.set_info_message(key=value.code, value=value)
-            return None
-        if isinstance(value, ErrorStringMessage) or isinstance(value, ErrorDetail):
-            self.set_error_message(key=value.code, value=value)
-            return None
-        if isinstance(value, WarningStringMessage):
-            self.set_warning_message(key=value.code, value=value)
-            return None
-        if isinstance(value, LogStringMessage):
-            self.set_log_message(key=value.code, value=value)
-            return None
-        if isinstance(value, ExceptionStringMessage):
-            self.set_exception_message(key=value.code, value=value)
-            return None
+        setter = _node_kind(type(value))[1]
+        if setter is None:
+            return value
 
-        return value
+        getattr(self, setter)(key=value.code, value=value)
+        return None
 
     class Cookie(BaseModel):
         key: str
@@ -724,14 +758,39 @@ class BaseAPI(APIView):
         ret = self.request.COOKIES.get(key)
         return ret
 
+    _COOKIE_DEFAULTS = MappingProxyType({
+        'value': "",
+        'max_age': None,
+        'expires': None,
+        'path': "/",
+        'domain': None,
+        'secure': False,
+        'httponly': False,
+        'samesite': None,
+    })
+
+    def __cookie(self, key: str, kwargs: dict):
+        ret = {'key': key, **self._COOKIE_DEFAULTS}
+        ret.update((k, v) for k, v in kwargs.items() if k in self._COOKIE_DEFAULTS)
+        return ret
+
     def cookie_setter(self, key: str, **kwargs):
-        ret = self.__cookies_for_set.append(self.Cookie(key=key, **kwargs).model_dump())
+        ret = self.__cookies_for_set.append(self.__cookie(key, kwargs))
+        return ret
+
+    def cookies_setter(self, cookies: dict):
+        ret = self.__cookies_for_set.extend(
+            self.__cookie(key, kwargs) for key, kwargs in cookies.items())
         return ret
 
     def cookie_deleter(self, key: str):
         ret = self.__cookies_for_delete.append(key)
         return ret
 
+    def cookies_deleter(self, keys):
+        ret = self.__cookies_for_delete.extend(keys)
+        return ret
+
 
 class CreateAPIView(BaseAPI, DRFGCreateAPIView):
     pass
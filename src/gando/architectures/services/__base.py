@@ -16,6 +16,14 @@ class CacheConfig(BaseModel):
     cache_unique_key: str | tuple | list | set | None = None
 
 
+_MISSING = object()
+
+
+def _config_attr(config, name, types, default):
+    value = getattr(config, name, _MISSING)
+    return value if isinstance(value, types) else default
+
+
 class BaseService:
     """
     - Config:
@@ -57,6 +65,33 @@ class BaseService:
                     - int or None
     """
 
+    __config_cache_prefix_key = ''
+    __config_cache_suffix_key = ''
+    __config_cache_middle_separator_key = ''
+    __config_cache = False
+    __config_cache_timeout = 5
+    __config_cache_key = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        config = getattr(cls, 'Config', None)
+        cls.__config_cache_prefix_key = _config_attr(config, 'cache_prefix_key', str, '')
+        cls.__config_cache_suffix_key = _config_attr(config, 'cache_suffix_key', str, '')
+        cls.__config_cache_middle_separator_key = _config_attr(config, 'cache_middle_separator_key', str, '')
+        cls.__config_cache = _config_attr(config, 'cache', bool, False)
+        cls.__config_cache_timeout = _config_attr(config, 'cache_timeout', (int, NoneType), 5)
+
+        cache_key = getattr(config, 'cache_key', _MISSING)
+        if cache_key is _MISSING:
+            cls.__config_cache_key = None
+        elif isinstance(cache_key, str):
+            cls.__config_cache_key = (cache_key,)
+        elif isinstance(cache_key, (tuple, list, set)):
+            cls.__config_cache_key = tuple(cache_key)
+        else:
+            cls.__config_cache_key = ()
+
     def __init__(self, *args, **kwargs):
         self.__input_cache_config: CacheConfig = CacheConfig(**kwargs)
 
@@ -85,88 +120,42 @@ class BaseService:
         if self.__input_cache_config.cache_prefix_key is not None:
             return self.__input_cache_config.cache_prefix_key
 
-        if (
-            hasattr(self, 'Config') and
-            hasattr(self.Config, 'cache_prefix_key') and
-            isinstance(self.Config.cache_prefix_key, str)
-        ):
-            return self.Config.cache_prefix_key
-
-        return ''
+        return self.__config_cache_prefix_key
 
     @property
     def cache_suffix_key(self):
         if self.__input_cache_config.cache_suffix_key is not None:
             return self.__input_cache_config.cache_suffix_key
 
-        if (
-            hasattr(self, 'Config') and
-            hasattr(self.Config, 'cache_suffix_key') and
-            isinstance(self.Config.cache_suffix_key, str)
-        ):
-            return self.Config.cache_suffix_key
-
-        return ''
+        return self.__config_cache_suffix_key
 
     @property
     def cache_middle_separator_key(self):
         if self.__input_cache_config.cache_middle_separator_key is not None:
             return self.__input_cache_config.cache_middle_separator_key
 
-        if (
-            hasattr(self, 'Config') and
-            hasattr(self.Config, 'cache_middle_separator_key') and
-            isinstance(self.Config.cache_middle_separator_key, str)
-        ):
-            return self.Config.cache_middle_separator_key
-
-        return ''
+        return self.__config_cache_middle_separator_key
 
     @property
     def cache(self):
         if self.__input_cache_config.cache is not None:
             return self.__input_cache_config.cache
 
-        if (
-            hasattr(self, 'Config') and
-            hasattr(self.Config, 'cache') and
-            isinstance(self.Config.cache, bool)
-        ):
-            return self.Config.cache
-
-        return False
+        return self.__config_cache
 
     @property
     def cache_timeout(self):
         if self.__input_cache_config.cache_timeout is not None:
             return self.__input_cache_config.cache_timeout
 
-        ret = 5
-        if hasattr(self, 'Config') and hasattr(self.Config, 'cache_timeout'):
-            if isinstance(self.Config.cache_timeout, int) or isinstance(self.Config.cache_timeout, NoneType):
-                ret = self.Config.cache_timeout
-
-        return ret
+        return self.__config_cache_timeout
 
     def cache_unique_key(self):
         if self.__input_cache_config.cache_unique_key is not None:
             return self.__input_cache_config.cache_unique_key
 
-        if hasattr(self, 'Config') and hasattr(self.Config, 'cache_key'):
-            keys = []
-            if isinstance(self.Config.cache_key, str):
-                keys = [self.Config.cache_key]
-
-            elif (
-                isinstance(self.Config.cache_key, tuple) or
-                isinstance(self.Config.cache_key, list) or
-                isinstance(self.Config.cache_key, set)
-            ):
-                keys = [i for i in self.Config.cache_key]
-
-            else:
-                pass
-
+        keys = self.__config_cache_key
+        if keys is not None:
             ret = (
                 self.cache_prefix_key +
                 self.cache_middle_separator_key.join(
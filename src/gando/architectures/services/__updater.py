@@ -15,11 +15,8 @@ class BaseUpdaterService(BaseDataBaseManagerService):
         return self.valid_key_input_data_list
 
     def __validate(self, **kwargs):
-        tmp = {}
-        for k, v in kwargs.items():
-            if k in self.valid_key_input_data:
-                tmp[k] = v
-        ret = tmp
+        valid_keys = set(self.valid_key_input_data)
+        ret = {k: v for k, v in kwargs.items() if k in valid_keys}
         return ret
 
     def __update_db_record(self):
@@ -8,8 +8,7 @@ def _get_user_agent_device_key(key):
     if not key:
         return None
     try:
-        obj = UserAgentDevice.objects.get(key=key)
-        return obj.key
+        return key if UserAgentDevice.objects.filter(key=key).exists() else None
     except:
         return None
 
@@ -53,7 +52,8 @@ class UserAgentDeviceMiddleware(MiddlewareMixin):
         setattr(request, 'uad', user_agent_device_id(request))
 
     def process_response(self, request, response):
-        self.process_request(request)
+        if getattr(request, 'uad', None) is None:
+            self.process_request(request)
 
         if SETTINGS.USER_AGENT_DEVICE_HANDLER.HANDLING is False:
             return response
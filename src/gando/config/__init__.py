@@ -1,9 +1,17 @@
 from pydantic import BaseModel as Base
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from typing import Callable
+import importlib
 
 from django.conf import settings
 
 
+@lru_cache(maxsize=None)
+def _resolve(dotted: str) -> Callable:
+    mod_name, func_name = dotted.rsplit('.', 1)
+    return getattr(importlib.import_module(mod_name), func_name)
+
+
 class ExceptionHandlerObject(Base):
     HANDLING: bool = False
     COMMUNICATION_WITH_SOFTWARE_SUPPORT: str = None
@@ -20,10 +28,20 @@ class Gando(Base):
     CACHING: bool = False
     MESSAGES_RESPONSE_DISPLAYED: bool = True
     MONITOR: dict = dict()
+    MONITOR_ASYNC: bool = False
+    MONITOR_WORKERS: int = 0
     EXCEPTION_HANDLER: ExceptionHandlerObject = ExceptionHandlerObject()
     PASTE_TO_REQUEST: dict = dict()
     USER_AGENT_DEVICE_HANDLER: UserAgentDeviceHandlerObject = UserAgentDeviceHandlerObject()
 
+    @cached_property
+    def paste_to_request_callables(self):
+        return tuple((k, _resolve(v)) for k, v in self.PASTE_TO_REQUEST.items())
+
+    @cached_property
+    def monitor_callables(self):
+        return tuple((k, _resolve(v)) for k, v in self.MONITOR.items())
+
 
 @lru_cache()
 def __get_settings():
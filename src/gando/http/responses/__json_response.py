@@ -1,5 +1,7 @@
 from typing import Optional, List, Dict
+import json
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http.response import JsonResponse as DJJsonResponse
 
 from gando.config import SETTINGS
@@ -32,7 +34,37 @@ class JsonResponse(DJJsonResponse):
             error_messages__=error_messages__,
             exception_messages__=exception_messages__,
         )
+        self.__parts = data, many, monitor, msgs
 
+        super(JsonResponse, self).__init__(
+            self.__context(data, many, monitor, msgs),
+            status=kwargs.get('status', 200)
+        )
+
+    def extend_messages(
+        self,
+
+        log_messages__: Optional[List[Dict[str, str]]] = None,
+        info_messages__: Optional[List[Dict[str, str]]] = None,
+        warning_messages__: Optional[List[Dict[str, str]]] = None,
+        error_messages__: Optional[List[Dict[str, str]]] = None,
+        exception_messages__: Optional[List[Dict[str, str]]] = None,
+    ):
+        data, many, monitor, msgs = self.__parts
+        msgs = {
+            'log_messages': msgs['log_messages'] + (log_messages__ or []),
+            'info_messages': msgs['info_messages'] + (info_messages__ or []),
+            'warning_messages': msgs['warning_messages'] + (warning_messages__ or []),
+            'error_messages': msgs['error_messages'] + (error_messages__ or []),
+            'exception_messages': msgs['exception_messages'] + (exception_messages__ or []),
+        }
+        self.__parts = data, many, monitor, msgs
+
+        self.content = json.dumps(self.__context(data, many, monitor, msgs), cls=DjangoJSONEncoder)
+        if self.has_header('Content-Length'):
+            self['Content-Length'] = str(len(self.content))
+
+    def __context(self, data, many, monitor, msgs):
         context = {
             'success': not (bool(msgs['error_messages']) or bool(msgs['exception_messages'])),
             'has_warning': bool(msgs['warning_messages']),
@@ -48,11 +80,8 @@ class JsonResponse(DJJsonResponse):
             'many': many,
         }
         context = context or {}
-        data = ResponseSchema(**context).model_dump()
-        super(JsonResponse, self).__init__(
-            data,
-            status=kwargs.get('status', 200)
-        )
+        ret = ResponseSchema(**context).model_dump()
+        return ret
 
     def __data_parser(self, data: Optional[dict | list | str], **kwargs):
 
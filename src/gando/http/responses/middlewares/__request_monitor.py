@@ -4,7 +4,7 @@ from typing import Any
 class Monitor:
     monitor: dict = {}
 
-    def __int__(self):
+    def __init__(self):
         self.monitor = {}
 
     def add(self, key: str, value: Any):
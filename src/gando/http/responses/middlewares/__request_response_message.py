@@ -18,7 +18,7 @@ class ResponseMessages:
     error: list = []
     exception: list = []
 
-    def __int__(self):
+    def __init__(self):
         self.log = []
         self.info = []
         self.warning = []
@@ -40,6 +40,9 @@ class ResponseMessages:
     def add2exceptions(self, msg_title: str, msg_content: str):
         self.exception.append({msg_title: msg_content})
 
+    def is_empty(self):
+        return not (self.log or self.info or self.warning or self.error or self.exception)
+
     def export(self):
         ret = MessagesSchema(
             log_messages=self.log,
@@ -1,7 +1,6 @@
 from django.utils.deprecation import MiddlewareMixin
 
 from gando.http.responses import JsonResponse as Response
-from rest_framework.response import Response as DRFResponse
 
 
 from .__request_monitor import Monitor
@@ -17,14 +16,13 @@ class JsonResponse(MiddlewareMixin):
     def process_response(self, request, response):
         rsp = response
         if isinstance(response, Response):
-            msg = request.response_messages.export()
-            dmsg = msg.model_dump()
-            rsp = DRFResponse(status=self.__get_status_code(response), **dmsg, **response.__dict__)
+            response_messages = request.response_messages
+            if not response_messages.is_empty():
+                rsp.extend_messages(
+                    log_messages__=response_messages.log,
+                    info_messages__=response_messages.info,
+                    warning_messages__=response_messages.warning,
+                    error_messages__=response_messages.error,
+                    exception_messages__=response_messages.exception,
+                )
         return rsp
-
-    def __get_status_code(self, response):
-        try:
-            status_code = getattr(response, 'status')
-        except:
-            status_code = getattr(response, 'status_code')
-        return status_code
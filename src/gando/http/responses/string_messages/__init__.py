@@ -1,38 +1,8 @@
-class InfoStringMessage(str):
-    code = 'info'
-
-    def __new__(cls, string, code=None):
-        self = super().__new__(cls, string)
-        self.code = code
-        return self
-
-    def __eq__(self, other):
-        result = super().__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        try:
-            return result and self.code == other.code
-        except AttributeError:
-            return result
-
-    def __ne__(self, other):
-        result = self.__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        return not result
+_MISSING = object()
 
-    def __repr__(self):
-        return 'InfoStringMessage(string=%r, code=%r)' % (
-            str(self),
-            self.code,
-        )
-
-    def __hash__(self):
-        return hash(str(self))
 
-
-class ErrorStringMessage(str):
-    code = 'error'
+class BaseStringMessage(str):
+    code = None
 
     def __new__(cls, string, code=None):
         self = super().__new__(cls, string)
@@ -43,10 +13,10 @@ class ErrorStringMessage(str):
         result = super().__eq__(other)
         if result is NotImplemented:
             return NotImplemented
-        try:
-            return result and self.code == other.code
-        except AttributeError:
+        code = getattr(other, 'code', _MISSING)
+        if code is _MISSING:
             return result
+        return result and self.code == code
 
     def __ne__(self, other):
         result = self.__eq__(other)
@@ -55,7 +25,8 @@ class ErrorStringMessage(str):
         return not result
 
     def __repr__(self):
-        return 'ErrorStringMessage(string=%r, code=%r)' % (
+        return '%s(string=%r, code=%r)' % (
+            type(self).__name__,
             str(self),
             self.code,
         )
@@ -64,100 +35,21 @@ class ErrorStringMessage(str):
         return hash(str(self))
 
 
-class WarningStringMessage(str):
-    code = 'warning'
-
-    def __new__(cls, string, code=None):
-        self = super().__new__(cls, string)
-        self.code = code
-        return self
+class InfoStringMessage(BaseStringMessage):
+    code = 'info'
 
-    def __eq__(self, other):
-        result = super().__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        try:
-            return result and self.code == other.code
-        except AttributeError:
-            return result
 
-    def __ne__(self, other):
-        result = self.__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        return not result
+class ErrorStringMessage(BaseStringMessage):
+    code = 'error'
 
-    def __repr__(self):
-        return 'WarningStringMessage(string=%r, code=%r)' % (
-            str(self),
-            self.code,
-        )
 
-    def __hash__(self):
-        return hash(str(self))
+class WarningStringMessage(BaseStringMessage):
+    code = 'warning'
 
 
-class LogStringMessage(str):
+class LogStringMessage(BaseStringMessage):
     code = 'log'
 
-    def __new__(cls, string, code=None):
-        self = super().__new__(cls, string)
-        self.code = code
-        return self
-
-    def __eq__(self, other):
-        result = super().__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        try:
-            return result and self.code == other.code
-        except AttributeError:
-            return result
-
-    def __ne__(self, other):
-        result = self.__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        return not result
-
-    def __repr__(self):
-        return 'LogStringMessage(string=%r, code=%r)' % (
-            str(self),
-            self.code,
-        )
-
-    def __hash__(self):
-        return hash(str(self))
-
 
-class ExceptionStringMessage(str):
+class ExceptionStringMessage(BaseStringMessage):
     code = 'exception'
-
-    def __new__(cls, string, code=None):
-        self = super().__new__(cls, string)
-        self.code = code
-        return self
-
-    def __eq__(self, other):
-        result = super().__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        try:
-            return result and self.code == other.code
-        except AttributeError:
-            return result
-
-    def __ne__(self, other):
-        result = self.__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-        return not result
-
-    def __repr__(self):
-        return 'ExceptionStringMessage(string=%r, code=%r)' % (
-            str(self),
-            self.code,
-        )
-
-    def __hash__(self):
-        return hash(str(self))